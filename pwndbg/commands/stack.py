@@ -1,3 +1,5 @@
+import re
+
 import gdb
 
 import pwndbg.chain
@@ -6,6 +8,52 @@ import pwndbg.gdblib.arch
 import pwndbg.regs
 import pwndbg.vmmap
 
+#: Number of frames unwound with gdb.Frame.older() before the remaining
+#: return addresses are parsed from a single `backtrace` command output
+MAX_FRAMES_WALKED = 32
+
+# Matches the frames in `backtrace` output and their address, if printed, e.g.:
+# #1  0x0000555555555156 in main () at test.c:9
+_BT_FRAME_RE = re.compile(r"^#\d+\s+(?:(0x[0-9a-f]+) in )?", re.MULTILINE)
+
+
+def return_addresses():
+    """
+    Returns the list of PCs of all frames in the backtrace, newest first.
+    """
+    frame = gdb.newest_frame()
+    addresses = []
+    for _ in range(MAX_FRAMES_WALKED):
+        if not frame:
+            return addresses
+        addresses.append(frame.pc())
+        frame = frame.older()
+
+    if not frame:
+        return addresses
+
+    # Don't let GDB format frame arguments, which reads the target memory
+    try:
+        backtrace = gdb.execute(
+            "backtrace -no-filters -frame-arguments none -frame-info location-and-address",
+            to_string=True,
+        )
+    except gdb.error:
+        # GDB versions older than 9 don't support these options
+        backtrace = ""
+
+    # Frames may be printed without their address, e.g. with `set print address off`
+    # or after `<signal handler called>`, in which case we unwind them ourselves
+    frame_addresses = _BT_FRAME_RE.findall(backtrace)[MAX_FRAMES_WALKED:]
+    if frame_addresses and all(frame_addresses):
+        addresses.extend(int(addr, 16) for addr in frame_addresses)
+    else:
+        while frame:
+            addresses.append(frame.pc())
+            frame = frame.older()
+
+    return addresses
+
 
 @pwndbg.commands.ArgparsedCommand("Print out the stack addresses that contain return addresses.")
 @pwndbg.commands.OnlyWhenRunning
@@ -14,21 +62,35 @@ def retaddr():
     stack = pwndbg.vmmap.find(sp)
 
     # Enumerate all return addresses
-    frame = gdb.newest_frame()
-    addresses = []
-    while frame:
-        addresses.append(frame.pc())
-        frame = frame.older()
+    addresses = return_addresses()
 
-    # Find all of them on the stack
+    # Find all of them on the stack, reading it at once instead of
+    # doing a memory read per stack slot
     start = stack.vaddr
     stop = start + stack.memsz
-    while addresses and start < sp < stop:
-        value = pwndbg.memory.u(sp)
+    if not (addresses and start < sp < stop):
+        return
+
+    ptrsize = pwndbg.gdblib.arch.ptrsize
+    data = pwndbg.memory.read(sp, (stop - sp) // ptrsize * ptrsize)
 
-        if value in addresses:
-            index = addresses.index(value)
-            del addresses[:index]
-            print(pwndbg.chain.format(sp))
+    # Look for each return address with bytes.find, which scans the data in C,
+    # rather than unpacking and checking every stack slot in Python
+    hits = []
+    for address in set(addresses):
+        packed = pwndbg.gdblib.arch.pack(address)
+        offset = data.find(packed)
+        while offset != -1:
+            if offset % ptrsize == 0:
+                hits.append((offset, address))
+            offset = data.find(packed, offset + 1)
 
-        sp += pwndbg.gdblib.arch.ptrsize
+    # Going up the stack, only print the addresses of the frame matched last
+    # or older ones, skipping stale copies of newer frames' addresses
+    index = 0
+    for offset, address in sorted(hits):
+        try:
+            index = addresses.index(address, index)
+        except ValueError:
+            continue
+        print(pwndbg.chain.format(sp + offset))
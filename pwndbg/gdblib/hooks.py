@@ -1,9 +1,12 @@
+import gdb
+
 import pwndbg.gdblib.events
 import pwndbg.gdblib.typeinfo
 from pwndbg.gdblib import arch_mod
 from pwndbg.lib.memoize import forever
 from pwndbg.lib.memoize import reset_on_cont
 from pwndbg.lib.memoize import reset_on_exit
+from pwndbg.lib.memoize import reset_on_frame_change
 from pwndbg.lib.memoize import reset_on_objfile
 from pwndbg.lib.memoize import reset_on_prompt
 from pwndbg.lib.memoize import reset_on_start
@@ -32,6 +35,7 @@ def update_arch():
 @pwndbg.gdblib.events.reg_changed
 def memoize_on_stop():
     reset_on_stop._reset()
+    reset_on_frame_change._reset()
 
 
 @pwndbg.gdblib.events.before_prompt
@@ -47,6 +51,7 @@ def memoize_on_cont():
 @pwndbg.gdblib.events.new_objfile
 def memoize_on_new_objfile():
     reset_on_objfile._reset()
+    reset_on_frame_change._reset()
 
 
 @pwndbg.gdblib.events.start
@@ -59,6 +64,17 @@ def memoize_on_start():
 def memoize_on_exit():
     while_running._reset()
     reset_on_exit._reset()
+    reset_on_frame_change._reset()
+
+
+def selected_frame():
+    try:
+        return gdb.selected_frame()
+    except gdb.error:
+        return None
+
+
+reset_on_frame_change.get_selected_frame = selected_frame
 
 
 def init():
@@ -3,6 +3,7 @@ Get information about the GLibc
 """
 
 import functools
+import os
 import re
 
 import gdb
@@ -14,6 +15,7 @@ import pwndbg.memory
 import pwndbg.proc
 import pwndbg.search
 import pwndbg.symbol
+import pwndbg.vmmap
 
 safe_lnk = pwndbg.config.Parameter(
     "safe-linking", "auto", "whether glibc use safe-linking (on/off/auto)"
@@ -21,19 +23,32 @@ safe_lnk = pwndbg.config.Parameter(
 
 glibc_version = pwndbg.config.Parameter("glibc", "", "GLIBC version for heuristics", scope="heap")
 
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+_BANNER_RE = re.compile(rb"release version (\d+)\.(\d+)")
+
 
 @pwndbg.proc.OnlyWhenRunning
 def get_version():
-    if glibc_version.value:
-        ret = re.search(r"(\d+)\.(\d+)", glibc_version.value)
-        if ret:
-            return tuple(int(_) for _ in ret.groups())
-        else:
-            raise ValueError(
-                "Invalid GLIBC version: `%s`, you should provide something like: 2.31 or 2.34"
-                % glibc_version.value
-            )
-    return _get_version()
+    return _parse_glibc_param() or _get_version()
+
+
+@pwndbg.lib.memoize.reset_on_objfile
+def _parse_glibc_param():
+    if not glibc_version.value:
+        return None
+    ret = _VERSION_RE.search(glibc_version.value)
+    if ret:
+        return tuple(int(_) for _ in ret.groups())
+    else:
+        raise ValueError(
+            "Invalid GLIBC version: `%s`, you should provide something like: 2.31 or 2.34"
+            % glibc_version.value
+        )
+
+
+@pwndbg.config.Trigger([glibc_version])
+def _reset_glibc_param():
+    _parse_glibc_param.clear()
 
 
 @pwndbg.proc.OnlyWhenRunning
@@ -45,14 +60,22 @@ def _get_version():
         if addr is not None:
             ver = pwndbg.memory.string(addr)
             return tuple([int(_) for _ in ver.split(b".")])
-    for addr in pwndbg.search.search(b"GNU C Library"):
+    # Searching the whole memory is slow, especially on remote targets, so we
+    # only search libc mappings. If there are none (e.g. statically linked
+    # binaries), `search` falls back to all mappings.
+    libc_mappings = [page for page in pwndbg.vmmap.get() if _is_libc(page.objfile)]
+    for addr in pwndbg.search.search(b"GNU C Library", mappings=libc_mappings):
         banner = pwndbg.memory.string(addr)
-        ret = re.search(rb"release version (\d+)\.(\d+)", banner)
+        ret = _BANNER_RE.search(banner)
         if ret:
             return tuple(int(_) for _ in ret.groups())
     return None
 
 
+def _is_libc(objfile):
+    return os.path.basename(objfile).startswith(("libc.", "libc-"))
+
+
 def OnlyWhenGlibcLoaded(function):
     @functools.wraps(function)
     def _OnlyWhenGlibcLoaded(*a, **kw):
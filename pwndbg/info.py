@@ -7,17 +7,22 @@ We probably don't need this anymore.
 import gdb
 
 import pwndbg.lib.memoize
+import pwndbg.qemu
 
 
-@pwndbg.lib.memoize.reset_on_exit
+@pwndbg.lib.memoize.reset_on_stop
 def proc_mapping():
+    # There are no process mappings to show under QEMU kernel debugging
+    if pwndbg.qemu.is_qemu_kernel():
+        return ""
+
     try:
         return gdb.execute("info proc mapping", to_string=True)
     except gdb.error:
         return ""
 
 
-@pwndbg.lib.memoize.reset_on_exit
+@pwndbg.lib.memoize.reset_on_objfile
 def auxv():
     try:
         return gdb.execute("info auxv", to_string=True)
@@ -28,7 +33,7 @@ def auxv():
         return ""
 
 
-@pwndbg.lib.memoize.reset_on_stop
+@pwndbg.lib.memoize.reset_on_objfile
 def files():
     try:
         return gdb.execute("info files", to_string=True)
@@ -153,6 +153,39 @@ class reset_on_cont(memoize):
     _reset = __reset_on_cont
 
 
+class reset_on_frame_change(memoize):
+    """
+    Memoizes until the registers of the inferior may have changed, or until
+    the selected frame differs from the one the values were cached for,
+    e.g. after `up`/`down`.
+    """
+
+    caches = []
+    kind = "frame"
+
+    #: Returns the selected frame; set up by pwndbg.gdblib.hooks
+    get_selected_frame = staticmethod(lambda: None)
+
+    #: The frame for which the values were cached
+    frame = None
+
+    def __call__(self, *args, **kwargs):
+        frame = reset_on_frame_change.get_selected_frame()
+        if frame != reset_on_frame_change.frame:
+            reset_on_frame_change._reset()
+            reset_on_frame_change.frame = frame
+
+        return super().__call__(*args, **kwargs)
+
+    @staticmethod
+    def __reset_on_frame_change():
+        for obj in reset_on_frame_change.caches:
+            obj.clear()
+        reset_on_frame_change.frame = None
+
+    _reset = __reset_on_frame_change
+
+
 class while_running(memoize):
     caches = []
     kind = "running"
@@ -178,4 +211,5 @@ def reset():
     reset_on_objfile._reset()
     reset_on_start._reset()
     reset_on_cont._reset()
+    reset_on_frame_change._reset()
     while_running._reset()
@@ -1,6 +1,4 @@
-from random import choice
-
-TIPS = [
+TIPS = (
     # GDB hints
     "GDB's `apropos <topic>` command displays all registered commands that are related to the given <topic>",
     "GDB's `follow-fork-mode` parameter can be used to set whether to trace parent or child after fork() calls",
@@ -21,8 +19,12 @@ TIPS = [
     "Use the `procinfo` command for better process introspection (than the GDB's `info proc` command)",
     "Want to display each context panel in a separate tmux window? See https://github.com/pwndbg/pwndbg/blob/dev/FEATURES.md#splitting--layouting-context",
     "The $heap_base GDB variable can be used to refer to the starting address of the heap after running the `heap` command",
-]
+)
+_N_TIPS = len(TIPS)
 
 
 def get_tip_of_the_day() -> str:
-    return choice(TIPS)
+    # Imported lazily, only when tips are enabled (see `show-tips`)
+    from random import randrange
+
+    return TIPS[randrange(_N_TIPS)]
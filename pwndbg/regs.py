@@ -12,6 +12,7 @@ import gdb
 
 import pwndbg.gdblib.arch
 import pwndbg.gdblib.events
+import pwndbg.gdblib.hooks
 import pwndbg.lib.memoize
 import pwndbg.proc
 import pwndbg.remote
@@ -74,13 +75,31 @@ class RegisterSet:
         self.retval = retval
 
         # In 'common', we don't want to lose the ordering of:
-        self.common = []
-        for reg in gpr + (frame, stack, pc) + tuple(flags):
-            if reg and reg not in self.common:
-                self.common.append(reg)
+        self.common = [reg for reg in dict.fromkeys(gpr + (frame, stack, pc) + tuple(flags)) if reg]
 
-        self.all = set(i for i in misc) | set(flags) | set(self.retaddr) | set(self.common)
-        self.all -= {None}
+        self.all = set(misc).union(flags, self.retaddr, self.common)
+        self.all.discard(None)
+
+        # All registers in the order used by `pwndbg.regs.all`, and the names
+        # yielded when iterating `pwndbg.regs`. Both are built once here as
+        # they are accessed on every context refresh.
+        ordered = []
+        for regset in (pc, stack, frame, retaddr, flags, gpr, misc):
+            if regset is None:
+                continue
+            elif isinstance(regset, (list, tuple)):
+                ordered.extend(regset)
+            elif isinstance(regset, dict):
+                ordered.extend(regset.keys())
+            else:
+                ordered.append(regset)
+        self._all_ordered = tuple(dict.fromkeys(ordered))
+        self._iter_set = frozenset(self.all | {"pc", "sp"})
+
+        # Registers read at once by `pwndbg.regs`: those shown in the register
+        # context and the ones saved by `update_last`
+        retaddr = (retaddr,) if isinstance(retaddr, str) else retaddr
+        self._snapshot_regs = tuple(dict.fromkeys(self.common + list(retaddr)))
 
     def __iter__(self):
         for r in self.all:
@@ -605,6 +624,26 @@ arch_to_regs = {
 }
 
 
+#: Name of the current architecture and its RegisterSet
+_current_arch = None
+_current_regset = None
+
+
+# These are the events on which the architecture is refreshed. This module
+# imports `pwndbg.gdblib.hooks` so that this runs only once it has been updated.
+@pwndbg.gdblib.events.start
+@pwndbg.gdblib.events.stop
+@pwndbg.gdblib.events.new_objfile
+def _update_current_regset():
+    global _current_arch, _current_regset
+    arch = pwndbg.gdblib.arch.current
+    if arch != _current_arch:
+        _current_arch, _current_regset = arch, arch_to_regs.get(arch)
+
+
+_update_current_regset()
+
+
 @pwndbg.proc.OnlyWhenRunning
 def gdb77_get_register(name):
     return gdb.parse_and_eval("$" + name)
@@ -622,24 +661,52 @@ except AttributeError:
     get_register = gdb77_get_register
 
 
+def _is_flags_register(regname):
+    return "eflags" in regname or "cpsr" in regname
+
+
+def _register_value(regname, value):
+    # The flags registers fit in 32 bits, so we can mask them instead
+    # of casting them to uint32 through GDB's type system
+    if _is_flags_register(regname):
+        return int(value) & 0xFFFFFFFF
+
+    size = pwndbg.gdblib.typeinfo.unsigned.get(value.type.sizeof, pwndbg.gdblib.typeinfo.ulong)
+    return int(value.cast(size)) & pwndbg.gdblib.arch.ptrmask
+
+
+#: Compiled regexes matching register names for `module.fix`, keyed by architecture
+_fix_regexes = {}
+
+
 # We need to manually make some ptrace calls to get fs/gs bases on Intel
 PTRACE_ARCH_PRCTL = 30
 ARCH_GET_FS = 0x1003
 ARCH_GET_GS = 0x1004
 
+# Loaded once, as `_fs_gs_helper` runs on every stop
+try:
+    _ptrace = ctypes.CDLL("libc.so.6").ptrace
+    _ptrace.argtypes = [ctypes.c_long, ctypes.c_long, ctypes.c_void_p, ctypes.c_long]
+    _ptrace.restype = ctypes.c_long
+except OSError:
+    _ptrace = None
+
 
 class module(ModuleType):
     last = {}
 
-    @pwndbg.lib.memoize.reset_on_stop
-    @pwndbg.lib.memoize.reset_on_prompt
+    @pwndbg.lib.memoize.reset_on_frame_change
     def __getattr__(self, attr):
         attr = attr.lstrip("$")
+        value = self._snapshot().get(attr)
+        if value is not None:
+            return value
+
         try:
-            # Seriously, gdb? Only accepts uint32.
-            if "eflags" in attr or "cpsr" in attr:
+            if _is_flags_register(attr):
                 value = gdb77_get_register(attr)
-                value = value.cast(pwndbg.gdblib.typeinfo.uint32)
+                return None if value is None else _register_value(attr, value)
             else:
                 value = get_register(attr)
                 if value is None and attr.lower() == "xpsr":
@@ -656,8 +723,6 @@ class module(ModuleType):
         except (ValueError, gdb.error):
             return None
 
-    @pwndbg.lib.memoize.reset_on_stop
-    @pwndbg.lib.memoize.reset_on_prompt
     def __getitem__(self, item):
         if not isinstance(item, str):
             print("Unknown register type: %r" % (item))
@@ -677,70 +742,86 @@ class module(ModuleType):
 
         return item
 
+    def _snapshot(self):
+        """
+        Returns a dict with the values of the common and return address
+        registers of the current architecture in the selected frame, read
+        in a single pass, along with the `pc` and `sp` aliases. Other
+        registers have to be read one by one.
+        """
+        if _current_regset is None or get_register != gdb79_get_register or not pwndbg.proc.alive:
+            return {}
+        try:
+            return self._frame_snapshot()
+        except gdb.error:
+            # e.g. when the selected thread is running
+            return {}
+
+    @pwndbg.lib.memoize.reset_on_frame_change
+    def _frame_snapshot(self):
+        regset = _current_regset
+        frame = gdb.selected_frame()
+        snapshot = {}
+        for regname in regset._snapshot_regs:
+            try:
+                snapshot[regname] = _register_value(regname, frame.read_register(regname))
+            except (ValueError, gdb.error):
+                continue
+
+        if regset.stack in snapshot:
+            snapshot.setdefault("sp", snapshot[regset.stack])
+        # On i8086 `pc` is adjusted by the code segment, see `__getattr__`
+        if regset.pc in snapshot and pwndbg.gdblib.arch.current != "i8086":
+            snapshot.setdefault("pc", snapshot[regset.pc])
+
+        return snapshot
+
     def __iter__(self):
-        regs = set(arch_to_regs[pwndbg.gdblib.arch.current]) | {"pc", "sp"}
-        for item in regs:
-            yield item
+        yield from _current_regset._iter_set
 
     @property
     def current(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current]
+        return _current_regset
 
     @property
     def gpr(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].gpr
+        return _current_regset.gpr
 
     @property
     def common(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].common
+        return _current_regset.common
 
     @property
     def frame(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].frame
+        return _current_regset.frame
 
     @property
     def retaddr(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].retaddr
+        return _current_regset.retaddr
 
     @property
     def flags(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].flags
+        return _current_regset.flags
 
     @property
     def stack(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].stack
+        return _current_regset.stack
 
     @property
     def retval(self):
-        return arch_to_regs[pwndbg.gdblib.arch.current].retval
+        return _current_regset.retval
 
     @property
     def all(self):
-        regs = arch_to_regs[pwndbg.gdblib.arch.current]
-        retval = []
-        for regset in (
-            regs.pc,
-            regs.stack,
-            regs.frame,
-            regs.retaddr,
-            regs.flags,
-            regs.gpr,
-            regs.misc,
-        ):
-            if regset is None:
-                continue
-            elif isinstance(regset, (list, tuple)):
-                retval.extend(regset)
-            elif isinstance(regset, dict):
-                retval.extend(regset.keys())
-            else:
-                retval.append(regset)
-        return retval
+        return _current_regset._all_ordered
 
     def fix(self, expression):
-        for regname in set(self.all + ["sp", "pc"]):
-            expression = re.sub(r"\$?\b%s\b" % regname, r"$" + regname, expression)
-        return expression
+        regex = _fix_regexes.get(_current_arch)
+        if regex is None:
+            regnames = sorted(set(self.all) | {"sp", "pc"})
+            regex = re.compile(r"\$?\b(%s)\b" % "|".join(map(re.escape, regnames)))
+            _fix_regexes[_current_arch] = regex
+        return regex.sub(r"$\1", expression)
 
     def items(self):
         for regname in self.all:
@@ -750,9 +831,11 @@ class module(ModuleType):
 
     @property
     def changed(self):
+        snapshot = self._snapshot()
         delta = []
         for reg, value in self.previous.items():
-            if self[reg] != value:
+            current = snapshot[reg] if reg in snapshot else self[reg]
+            if current != value:
                 delta.append(reg)
         return delta
 
@@ -777,8 +860,9 @@ class module(ModuleType):
             if get_register == gdb79_get_register:
                 return get_register(regname)
 
-        # We can't really do anything if the process is remote.
-        if pwndbg.remote.is_remote():
+        # We can't really do anything if the process is remote
+        # or if there is no libc to call ptrace through.
+        if pwndbg.remote.is_remote() or _ptrace is None:
             return 0
 
         # Use the lightweight process ID
@@ -789,8 +873,7 @@ class module(ModuleType):
         value = ppvoid(ctypes.c_void_p())
         value.contents.value = 0
 
-        libc = ctypes.CDLL("libc.so.6")
-        result = libc.ptrace(PTRACE_ARCH_PRCTL, lwpid, value, which)
+        result = _ptrace(PTRACE_ARCH_PRCTL, lwpid, value, which)
 
         if result == 0:
             return (value.contents.value or 0) & pwndbg.gdblib.arch.ptrmask
@@ -810,7 +893,10 @@ sys.modules[__name__] = module(__name__, "")
 @pwndbg.gdblib.events.stop
 def update_last():
     M = sys.modules[__name__]
-    M.previous = M.last
-    M.last = {k: M[k] for k in M.common}
+    regnames = list(M.common)
     if pwndbg.config.show_retaddr_reg:
-        M.last.update({k: M[k] for k in M.retaddr})
+        regnames.extend(M.retaddr)
+
+    snapshot = M._snapshot()
+    M.previous = M.last
+    M.last = {k: snapshot[k] if k in snapshot else M[k] for k in regnames}
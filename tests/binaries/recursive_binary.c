@@ -0,0 +1,15 @@
+#include <stdio.h>
+
+void break_here() {}
+
+void recurse(int depth) {
+    if (depth == 0) {
+        break_here();
+        return;
+    }
+    recurse(depth - 1);
+}
+
+int main() {
+    recurse(64);
+}
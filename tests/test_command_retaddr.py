@@ -0,0 +1,26 @@
+import gdb
+
+import pwndbg.memory
+import tests
+
+TELESCOPE_BINARY = tests.binaries.get("telescope_binary.out")
+
+
+def test_command_retaddr(start_binary):
+    """
+    Tests that retaddr prints the stack slot holding the return address into main
+    """
+    start_binary(TELESCOPE_BINARY)
+
+    gdb.execute("break break_here")
+    gdb.execute("run")
+
+    # The return address of break_here is right above its saved frame pointer
+    slot = int(gdb.parse_and_eval("$rbp")) + 8
+    return_address = gdb.selected_frame().older().pc()
+    assert pwndbg.memory.u64(slot) == return_address
+
+    result_lines = gdb.execute("retaddr", to_string=True).splitlines()
+
+    assert hex(slot) in result_lines[0]
+    assert hex(return_address) in result_lines[0]
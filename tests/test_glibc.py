@@ -0,0 +1,21 @@
+import gdb
+
+import pwndbg.glibc
+import tests
+
+HEAP_BINARY = tests.binaries.get("heap_bins.out")
+
+
+def test_glibc_version_parameter(start_binary):
+    """
+    Tests that changing the `glibc` parameter changes the reported version
+    """
+    start_binary(HEAP_BINARY)
+
+    gdb.execute("set glibc 2.31")
+    assert pwndbg.glibc.get_version() == (2, 31)
+
+    gdb.execute("set glibc 2.34")
+    assert pwndbg.glibc.get_version() == (2, 34)
+
+    gdb.execute('set glibc ""')
@@ -0,0 +1,42 @@
+import gdb
+
+import pwndbg.regs
+import tests
+
+TELESCOPE_BINARY = tests.binaries.get("telescope_binary.out")
+
+
+def test_regs_follow_selected_frame(start_binary):
+    """
+    Tests that register values are not served from the previously selected frame
+    """
+    start_binary(TELESCOPE_BINARY)
+
+    gdb.execute("break break_here")
+    gdb.execute("run")
+
+    pc = pwndbg.regs.pc
+    rsp = pwndbg.regs.rsp
+    assert pc == gdb.selected_frame().pc()
+
+    gdb.execute("up")
+    assert pwndbg.regs.pc == gdb.selected_frame().pc() != pc
+    assert pwndbg.regs.rsp == int(gdb.parse_and_eval("$rsp")) != rsp
+
+    gdb.execute("down")
+    assert pwndbg.regs.pc == pc
+    assert pwndbg.regs.rsp == rsp
+
+
+def test_regs_fix(start_binary):
+    """
+    Tests that register names in expressions are prefixed with $ exactly once
+    """
+    start_binary(TELESCOPE_BINARY)
+
+    assert pwndbg.regs.fix("x/gx rsp+8*rax") == "x/gx $rsp+8*$rax"
+    assert pwndbg.regs.fix("x/gx $rsp+8*$rax") == "x/gx $rsp+8*$rax"
+    assert pwndbg.regs.fix("print rip-r8+dil; $pc") == "print $rip-$r8+$dil; $pc"
+    assert pwndbg.regs.fix("x/gx spl+sp") == "x/gx $spl+$sp"
+    assert pwndbg.regs.fix("print sp_offset+al") == "print sp_offset+$al"
+    assert pwndbg.regs.fix("break_here") == "break_here"
@@ -0,0 +1,48 @@
+import gdb
+
+import pwndbg.commands.stack
+import tests
+
+RECURSIVE_BINARY = tests.binaries.get("recursive_binary.out")
+
+
+def walk_frames():
+    frame = gdb.newest_frame()
+    addresses = []
+    while frame:
+        addresses.append(frame.pc())
+        frame = frame.older()
+    return addresses
+
+
+def test_return_addresses_deep_backtrace(start_binary):
+    """
+    Tests that the addresses parsed from `backtrace` line up with the unwound frames
+    """
+    start_binary(RECURSIVE_BINARY)
+
+    gdb.execute("break break_here")
+    gdb.execute("run")
+
+    expected = walk_frames()
+    assert len(expected) > pwndbg.commands.stack.MAX_FRAMES_WALKED + 1
+
+    assert pwndbg.commands.stack.return_addresses() == expected
+
+
+def test_return_addresses_without_printed_addresses(start_binary):
+    """
+    Tests that frames are unwound with gdb.Frame.older() if `backtrace` doesn't print their address
+    """
+    start_binary(RECURSIVE_BINARY)
+
+    gdb.execute("break break_here")
+    gdb.execute("run")
+
+    expected = walk_frames()
+
+    gdb.execute("set print address off")
+    try:
+        assert pwndbg.commands.stack.return_addresses() == expected
+    finally:
+        gdb.execute("set print address on")